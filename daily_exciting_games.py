@@ -12,11 +12,25 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from excitement import ExcitementAnalysis, calculate_excitement, load_home_win_probabilities
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+try:
+    import requests_cache
+except ImportError:  # pragma: no cover - optional dependency
+    requests_cache = None  # type: ignore
+
 try:
     from zoneinfo import ZoneInfo
 except ImportError:  # pragma: no cover - Python < 3.9 fallback
@@ -24,6 +38,11 @@ except ImportError:  # pragma: no cover - Python < 3.9 fallback
 
 SCOREBOARD_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
 SUMMARY_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/summary"
+MAX_WORKERS = 16
+EASTERN = ZoneInfo("America/New_York") if ZoneInfo else None
+CACHE_PATH = Path.home() / ".cache" / "watch-worthy.sqlite"
+CACHE_EXPIRY = dt.timedelta(days=30)
+RECENT_SCOREBOARD_EXPIRY = dt.timedelta(minutes=15)
 
 
 def determine_target_date(raw: Optional[str]) -> dt.date:
@@ -31,17 +50,79 @@ def determine_target_date(raw: Optional[str]) -> dt.date:
     if raw:
         return dt.date.fromisoformat(raw)
 
-    if ZoneInfo is None:
+    if EASTERN is None:
         eastern_now = dt.datetime.utcnow()
     else:
-        eastern_now = dt.datetime.now(tz=ZoneInfo("America/New_York"))
+        eastern_now = dt.datetime.now(tz=EASTERN)
     return (eastern_now - dt.timedelta(days=1)).date()
 
 
-def fetch_json(url: str, *, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """Fetch a JSON payload, raising an informative error on failure."""
-    response = requests.get(url, params=params, timeout=10)
+def is_cacheable(response: requests.Response) -> bool:
+    """Cache scoreboards, but only summaries of games that have finished."""
+    if not response.url.startswith(SUMMARY_URL):
+        return True
+    try:
+        status = response.json()["header"]["competitions"][0]["status"]
+        return bool(status["type"]["completed"])
+    except (ValueError, KeyError, IndexError, TypeError):
+        return False
+
+
+def scoreboard_expiry(target_date: dt.date) -> dt.timedelta:
+    """Expire recent scoreboards quickly, since their games may still be in progress."""
+    if target_date >= dt.date.today() - dt.timedelta(days=2):
+        return RECENT_SCOREBOARD_EXPIRY
+    return CACHE_EXPIRY
+
+
+def create_session() -> requests.Session:
+    """Build a pooled HTTP session that retries transient ESPN failures.
+
+    Responses are cached on disk when requests-cache is installed.
+    """
+    if requests_cache is not None:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        session = requests_cache.CachedSession(
+            str(CACHE_PATH),
+            backend="sqlite",
+            expire_after=CACHE_EXPIRY,
+            allowable_methods=("GET",),
+            filter_fn=is_cacheable,
+        )
+    else:
+        session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+    session.mount("https://", adapter)
+    return session
+
+
+def fetch_json(
+    session: requests.Session,
+    url: str,
+    *,
+    params: Optional[Dict[str, Any]] = None,
+    expire_after: Optional[dt.timedelta] = None,
+    refresh: bool = False,
+) -> Dict[str, Any]:
+    """Fetch a JSON payload, raising an informative error on failure.
+
+    ``expire_after`` overrides the cache lifetime for this response, and ``refresh``
+    bypasses any cached copy and stores the fresh one. Both are ignored without
+    requests-cache.
+    """
+    cache_options: Dict[str, Any] = {}
+    if requests_cache is not None and isinstance(session, requests_cache.CachedSession):
+        cache_options = {"expire_after": expire_after, "force_refresh": refresh}
+    response = session.get(url, params=params, timeout=10, **cache_options)
     response.raise_for_status()
+    if orjson is not None:
+        return orjson.loads(response.content)
     return response.json()
 
 
@@ -74,19 +155,21 @@ def describe_matchup(competitors: List[Dict[str, Any]]) -> str:
     return f"{away_name} at {home_name}"
 
 
-def analyze_game(event_id: str, competitors: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+def analyze_game(
+    session: requests.Session, event_id: str, matchup: str, *, refresh: bool = False
+) -> Optional[Dict[str, Any]]:
     """Fetch summary data for a game and return excitement analysis if available."""
-    summary = fetch_json(SUMMARY_URL, params={"event": event_id})
+    summary = fetch_json(session, SUMMARY_URL, params={"event": event_id}, refresh=refresh)
     winprob = summary.get("winprobability")
-    if not isinstance(winprob, list) or not winprob:
+    if not isinstance(winprob, list) or len(winprob) < 2:
         return None
 
-    probabilities = load_home_win_probabilities(winprob)
+    probabilities = load_home_win_probabilities(winprob, as_array=True)
     analysis: ExcitementAnalysis = calculate_excitement(probabilities)
 
     return {
         "event_id": event_id,
-        "matchup": describe_matchup(competitors),
+        "matchup": matchup,
         "analysis": analysis,
     }
 
@@ -99,13 +182,25 @@ def main() -> int:
         "--date",
         help="ISO date (YYYY-MM-DD) to analyze. Defaults to yesterday in Eastern Time.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached ESPN responses and refresh them from the network.",
+    )
     args = parser.parse_args()
 
     target_date = determine_target_date(args.date)
     yyyymmdd = target_date.strftime("%Y%m%d")
 
+    session = create_session()
     try:
-        scoreboard = fetch_json(SCOREBOARD_URL, params={"dates": yyyymmdd})
+        scoreboard = fetch_json(
+            session,
+            SCOREBOARD_URL,
+            params={"dates": yyyymmdd},
+            expire_after=scoreboard_expiry(target_date),
+            refresh=args.no_cache,
+        )
     except requests.HTTPError as exc:
         print(f"Failed to fetch scoreboard for {target_date}: {exc}", file=sys.stderr)
         return 1
@@ -116,18 +211,30 @@ def main() -> int:
         return 0
 
     results = []
-    for game in games:
-        try:
-            outcome = analyze_game(game["event_id"], game["competitors"])
-        except requests.HTTPError as exc:
-            print(f"Failed to fetch summary for event {game['event_id']}: {exc}", file=sys.stderr)
-            continue
-        except (KeyError, ValueError) as exc:
-            print(f"Skipping event {game['event_id']}: {exc}", file=sys.stderr)
-            continue
-
-        if outcome:
-            results.append(outcome)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        jobs = []
+        for game in games:
+            matchup = describe_matchup(game["competitors"])
+            job = executor.submit(
+                analyze_game, session, game["event_id"], matchup, refresh=args.no_cache
+            )
+            jobs.append((game["event_id"], matchup, job))
+
+        for event_id, matchup, job in jobs:
+            try:
+                outcome = job.result()
+            except requests.HTTPError as exc:
+                print(
+                    f"Failed to fetch summary for {matchup} (event {event_id}): {exc}",
+                    file=sys.stderr,
+                )
+                continue
+            except (KeyError, ValueError) as exc:
+                print(f"Skipping {matchup} (event {event_id}): {exc}", file=sys.stderr)
+                continue
+
+            if outcome:
+                results.append(outcome)
 
     if not results:
         print(f"No excitement data available for {target_date}.")
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Sequence
+from typing import List, Sequence, Tuple, Union
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ExcitementAnalysis:
     score: float
     verdict: str
@@ -16,9 +21,21 @@ class ExcitementAnalysis:
     close_ratio: float
 
 
-def load_home_win_probabilities(source: Sequence[dict]) -> List[float]:
-    """Extract and validate home win probability values."""
-    probabilities: List[float] = []
+def load_home_win_probabilities_with_ids(
+    source: Sequence[dict],
+) -> Tuple[Union[np.ndarray, List[float]], List[str]]:
+    """Extract validated home win probabilities and their play ids in one pass.
+
+    Plays without a ``playId`` are labelled with their position in ``source``.
+    Probabilities come back as a float64 ndarray, or a list if NumPy is missing.
+    """
+    if not source:
+        raise ValueError("No win probability data available")
+    if np is not None:
+        probabilities = np.empty(len(source), dtype=np.float64)
+    else:
+        probabilities = [0.0] * len(source)
+    play_ids = [""] * len(source)
     for index, play in enumerate(source):
         if "homeWinPercentage" not in play:
             raise KeyError(f"winprobability[{index}] missing 'homeWinPercentage'")
@@ -27,10 +44,67 @@ def load_home_win_probabilities(source: Sequence[dict]) -> List[float]:
             raise ValueError(
                 f"winprobability[{index}].homeWinPercentage must be between 0 and 1"
             )
-        probabilities.append(value)
-    if not probabilities:
-        raise ValueError("No win probability data available")
-    return probabilities
+        probabilities[index] = value
+        play_ids[index] = play.get("playId", str(index))
+    return probabilities, play_ids
+
+
+def load_home_win_probabilities(
+    source: Sequence[dict], *, as_array: bool = False
+) -> Union[List[float], np.ndarray]:
+    """Extract and validate home win probability values.
+
+    Pass ``as_array=True`` to get a float64 ndarray ready for ``calculate_excitement``
+    (ignored when NumPy is not installed).
+    """
+    probabilities, _ = load_home_win_probabilities_with_ids(source)
+    if as_array or np is None:
+        return probabilities
+    return probabilities.tolist()
+
+
+def _accumulate_swings(probabilities: Sequence[float]) -> Tuple[float, float, int, int]:
+    """Return total swing, largest swing, lead changes and toss-up count in one pass.
+
+    Uses running accumulators only, so no intermediate swing list is allocated.
+    """
+    total_swing = 0.0
+    max_swing = 0.0
+    lead_changes = 0
+    close_count = 0
+    prev = probabilities[0]
+    if 0.45 <= prev <= 0.55:
+        close_count += 1
+    for index in range(1, len(probabilities)):
+        curr = probabilities[index]
+        swing = abs(curr - prev)
+        total_swing += swing
+        if swing > max_swing:
+            max_swing = swing
+        if (prev >= 0.5) != (curr >= 0.5):
+            lead_changes += 1
+        if 0.45 <= curr <= 0.55:
+            close_count += 1
+        prev = curr
+    return total_swing, max_swing, lead_changes, close_count
+
+
+def _vectorized_swings(probabilities: np.ndarray) -> Tuple[float, float, int, int]:
+    """NumPy equivalent of ``_accumulate_swings``."""
+    swings = np.abs(np.diff(probabilities))
+    home_ahead = probabilities >= 0.5
+    return (
+        float(swings.sum()),
+        float(swings.max()),
+        int(np.count_nonzero(home_ahead[1:] != home_ahead[:-1])),
+        int(np.count_nonzero((probabilities >= 0.45) & (probabilities <= 0.55))),
+    )
+
+
+if np is not None:
+    _swing_statistics = _vectorized_swings
+else:
+    _swing_statistics = _accumulate_swings
 
 
 def calculate_excitement(probabilities: Sequence[float]) -> ExcitementAnalysis:
@@ -38,20 +112,11 @@ def calculate_excitement(probabilities: Sequence[float]) -> ExcitementAnalysis:
     if len(probabilities) < 2:
         raise ValueError("Need at least two win probability points to analyze the game")
 
-    swings = [
-        abs(curr - prev) for prev, curr in zip(probabilities, probabilities[1:])
-    ]
-    total_swing = sum(swings)
-    avg_swing = total_swing / len(swings)
-    max_swing = max(swings)
-    lead_changes = sum(
-        1
-        for prev, curr in zip(probabilities, probabilities[1:])
-        if (prev >= 0.5) != (curr >= 0.5)
-    )
-    close_ratio = sum(1 for p in probabilities if 0.45 <= p <= 0.55) / len(
-        probabilities
-    )
+    if np is not None:
+        probabilities = np.asarray(probabilities, dtype=np.float64)
+    total_swing, max_swing, lead_changes, close_count = _swing_statistics(probabilities)
+    avg_swing = total_swing / (len(probabilities) - 1)
+    close_ratio = close_count / len(probabilities)
 
     score = (
         min(avg_swing / 0.04, 1.0) * 2.5
@@ -36,7 +36,7 @@ def main() -> None:
     if "winprobability" not in payload:
         raise KeyError("JSON is missing the top-level 'winprobability' field")
 
-    probabilities = load_home_win_probabilities(payload["winprobability"])
+    probabilities = load_home_win_probabilities(payload["winprobability"], as_array=True)
     analysis = calculate_excitement(probabilities)
 
     print(f"Verdict: {analysis.verdict} ({analysis.score:.2f}/10)")
@@ -11,21 +11,97 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import json
-import re
+import string
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from excitement import ExcitementAnalysis, calculate_excitement, load_home_win_probabilities
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+try:
+    import requests_cache
+except ImportError:  # pragma: no cover - optional dependency
+    requests_cache = None  # type: ignore
+
+from excitement import (
+    ExcitementAnalysis,
+    calculate_excitement,
+    load_home_win_probabilities_with_ids,
+)
 
 SCOREBOARD_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
 SUMMARY_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/summary"
+MAX_WORKERS = 16
+CACHE_PATH = Path.home() / ".cache" / "watch-worthy.sqlite"
+CACHE_EXPIRY = dt.timedelta(days=30)
+RECENT_SCOREBOARD_EXPIRY = dt.timedelta(minutes=15)
+
+
+def is_cacheable(response: requests.Response) -> bool:
+    """Cache scoreboards, but only summaries of games that have finished."""
+    if not response.url.startswith(SUMMARY_URL):
+        return True
+    try:
+        status = response.json()["header"]["competitions"][0]["status"]
+        return bool(status["type"]["completed"])
+    except (ValueError, KeyError, IndexError, TypeError):
+        return False
+
+
+def scoreboard_expiry(target_date: dt.date) -> dt.timedelta:
+    """Expire recent scoreboards quickly, since their games may still be in progress."""
+    if target_date >= dt.date.today() - dt.timedelta(days=2):
+        return RECENT_SCOREBOARD_EXPIRY
+    return CACHE_EXPIRY
+
+
+def create_session() -> requests.Session:
+    if requests_cache is not None:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        session = requests_cache.CachedSession(
+            str(CACHE_PATH),
+            backend="sqlite",
+            expire_after=CACHE_EXPIRY,
+            allowable_methods=("GET",),
+            filter_fn=is_cacheable,
+        )
+    else:
+        session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+    session.mount("https://", adapter)
+    return session
 
 
-def fetch_json(url: str, *, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    response = requests.get(url, params=params, timeout=10)
+def fetch_json(
+    session: requests.Session,
+    url: str,
+    *,
+    params: Optional[Dict[str, Any]] = None,
+    expire_after: Optional[dt.timedelta] = None,
+    refresh: bool = False,
+) -> Dict[str, Any]:
+    cache_options: Dict[str, Any] = {}
+    if requests_cache is not None and isinstance(session, requests_cache.CachedSession):
+        cache_options = {"expire_after": expire_after, "force_refresh": refresh}
+    response = session.get(url, params=params, timeout=10, **cache_options)
     response.raise_for_status()
+    if orjson is not None:
+        return orjson.loads(response.content)
     return response.json()
 
 
@@ -56,36 +132,44 @@ def describe_matchup(competitors: List[Dict[str, Any]]) -> str:
     return f"{away_name} at {home_name}"
 
 
+class _SlugTable(dict):
+    """str.translate table mapping every non-ASCII-alphanumeric code point to '_'."""
+
+    _KEEP = frozenset(map(ord, string.ascii_letters + string.digits))
+
+    def __missing__(self, code_point: int) -> str:
+        replacement = chr(code_point) if code_point in self._KEEP else "_"
+        self[code_point] = replacement
+        return replacement
+
+
+_SLUG_TABLE = _SlugTable()
+
+
 def slugify(value: str) -> str:
-    value = re.sub(r"[^A-Za-z0-9]+", "_", value)
-    value = re.sub(r"_+", "_", value).strip("_")
-    return value or "game"
+    parts = value.translate(_SLUG_TABLE).split("_")
+    return "_".join(part for part in parts if part) or "game"
 
 
 def plot_win_probability(
-    probabilities: List[float],
+    ax: Any,
+    probabilities: np.ndarray,
     play_ids: List[str],
     matchup: str,
     date_label: str,
     excitement: ExcitementAnalysis,
-    output_path: Path,
 ) -> None:
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
-
-    percent_values = [p * 100 for p in probabilities]
-    indices = list(range(len(percent_values)))
+    percent_values = np.asarray(probabilities, dtype=np.float64) * 100.0
+    indices = np.arange(len(percent_values))
     labels = [pid[-3:] if len(pid) > 3 else pid for pid in play_ids]
+    home_ahead = percent_values >= 50.0
 
-    fig, ax = plt.subplots(figsize=(10, 4.5))
     ax.plot(indices, percent_values, color="#1f77b4", linewidth=2, label="Home win %")
     ax.fill_between(
         indices,
         percent_values,
         50,
-        where=[value >= 50 for value in percent_values],
+        where=home_ahead,
         color="#1f77b4",
         alpha=0.15,
     )
@@ -93,7 +177,7 @@ def plot_win_probability(
         indices,
         percent_values,
         50,
-        where=[value < 50 for value in percent_values],
+        where=~home_ahead,
         color="#d62728",
         alpha=0.15,
     )
@@ -109,12 +193,8 @@ def plot_win_probability(
 
     tick_count = min(10, len(labels))
     if tick_count > 1:
-        step = max(1, len(labels) // tick_count)
-        positions = indices[::step]
-        tick_labels = labels[::step]
-        if len(positions) > tick_count:
-            positions = positions[:tick_count]
-            tick_labels = tick_labels[:tick_count]
+        positions = np.linspace(0, len(labels) - 1, tick_count, dtype=int)
+        tick_labels = [labels[position] for position in positions]
         ax.set_xticks(positions)
         ax.set_xticklabels(tick_labels, rotation=45, fontsize=8)
     else:
@@ -124,10 +204,80 @@ def plot_win_probability(
     ax.legend(loc="lower center", ncol=3, frameon=False)
     ax.grid(axis="y", linestyle=":", linewidth=0.5, alpha=0.5)
 
-    fig.tight_layout()
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=150)
-    plt.close(fig)
+
+_DASHBOARD_HEAD = """\
+<!DOCTYPE html>
+<html lang='en'>
+<head>
+  <meta charset='utf-8' />
+  <meta name='viewport' content='width=device-width, initial-scale=1' />
+  <title>Weekly NBA Excitement Dashboard</title>
+  <style>
+    :root { color-scheme: dark; }
+    body { font-family: 'Inter', 'Segoe UI', Arial, sans-serif; background:#0c1116; color:#e3f2fd; margin:0; padding:0; }
+    header { padding: 28px 34px 22px; background: linear-gradient(135deg,#1a237e,#0d47a1 40%,#26a69a); box-shadow:0 12px 32px rgba(13,71,161,0.35); }
+    header h1 { margin:0; font-size: 30px; font-weight:700; color:#fff; letter-spacing:0.4px; }
+    header p { margin:10px 0 0; color:#bbdefb; max-width:720px; line-height:1.45; }
+    main { padding: 28px 34px 56px; }
+    section { margin-bottom: 52px; }
+    section h2 { font-size:24px; margin:0 0 18px; color:#80deea; letter-spacing:0.3px; }
+    .grid { display:grid; gap:26px; grid-template-columns: repeat(auto-fit, minmax(320px, 1fr)); }
+    .card { background:#121a21; border-radius:16px; border:1px solid rgba(128,222,234,0.18); overflow:hidden; box-shadow:0 12px 32px rgba(0,0,0,0.45); display:flex; flex-direction:column; }
+    .card header { padding:20px 22px 18px; border-bottom:1px solid rgba(128,222,234,0.12); background:linear-gradient(135deg,rgba(38,166,154,0.18),rgba(13,71,161,0.18)); }
+    .card header h3 { margin:0; font-size:19px; color:#fff; letter-spacing:0.2px; }
+    .card header p { margin:6px 0 0; color:#b0bec5; font-size:14px; letter-spacing:0.4px; text-transform:uppercase; }
+    .meter { margin:22px 22px 0; height:18px; background:#0f1419; border-radius:999px; position:relative; overflow:hidden; border:1px solid rgba(128,222,234,0.35); box-shadow: inset 0 0 12px rgba(0,0,0,0.45); }
+    .meter .fill { display:block; height:100%; border-radius:999px; background:linear-gradient(90deg,#ef5350,#ffa726,#ffee58,#66bb6a,#26a69a); box-shadow:0 0 20px rgba(102,187,106,0.45); transition:width 0.6s ease; }
+    .meter-label { margin:12px 22px 0; font-size:13px; letter-spacing:0.6px; color:#e0f2f1; text-transform:uppercase; }
+    .card footer { padding:14px 22px 20px; color:#cfd8dc; font-size:13px; background:#10161c; border-top:1px solid rgba(128,222,234,0.12); }
+    .metrics { margin:10px 0 0; display:flex; flex-wrap:wrap; gap:12px; font-size:12px; letter-spacing:0.8px; text-transform:uppercase; }
+    .chip { background:rgba(12,97,109,0.45); padding:7px 12px; border-radius:999px; border:1px solid rgba(128,222,234,0.28); color:#80deea; }
+    .chip strong { color:#e1f5fe; margin-left:4px; font-size:12px; }
+    .note { margin-top: 10px; font-size:12px; color:#90a4ae; letter-spacing:0.3px; }
+    @media (max-width: 720px) { main { padding: 20px 18px 48px; } header { padding: 24px 18px 20px; } }
+  </style>
+</head>
+<body>
+  <header>
+    <h1>Weekly NBA Excitement Dashboard</h1>
+    <p>Each card shows how wild the win-probability swings were without revealing final scores. The excitement bar is scaled 0–10, with colors shifting from calm (left) to chaos (right).</p>
+  </header>
+  <main>"""
+
+_DASHBOARD_TAIL = """\
+  </main>
+</body>
+</html>"""
+
+_SECTION_TEMPLATE = """\
+    <section>
+      <h2>{date}</h2>
+      <div class='grid'>
+{cards}
+      </div>
+    </section>"""
+
+_CARD_TEMPLATE = """\
+        <article class='card'>
+          <header>
+            <h3>{rank}. {matchup}</h3>
+            <p>{verdict} &nbsp;&bull;&nbsp; {score:.2f}/10 excitement</p>
+          </header>
+          <div class='meter' role='img' aria-label='Excitement {score:.2f} out of 10'>
+            <span class='fill' style='width:{score_pct};'></span>
+          </div>
+          <p class='meter-label'>Intensity meter: {score:.2f}/10</p>
+          <footer>
+            <div class='metrics'>
+              <span class='chip'>Lead changes<strong>{lead_changes}</strong></span>
+              <span class='chip'>Biggest swing<strong>{max_swing:.3f}</strong></span>{chart_chip}
+            </div>
+            <p class='note'>Higher bars mean more volatile finish-time drama.</p>
+          </footer>
+        </article>"""
+
+_CHART_CHIP_TEMPLATE = """
+              <span class='chip'>Chart saved<strong>{image}</strong></span>"""
 
 
 def build_dashboard(
@@ -136,94 +286,23 @@ def build_dashboard(
     dashboard_path: Path,
     include_charts: bool,
 ) -> None:
-    html_parts = [
-        "<!DOCTYPE html>",
-        "<html lang='en'>",
-        "<head>",
-        "  <meta charset='utf-8' />",
-        "  <meta name='viewport' content='width=device-width, initial-scale=1' />",
-        "  <title>Weekly NBA Excitement Dashboard</title>",
-        "  <style>",
-        "    :root { color-scheme: dark; }",
-        "    body { font-family: 'Inter', 'Segoe UI', Arial, sans-serif; background:#0c1116; color:#e3f2fd; margin:0; padding:0; }",
-        "    header { padding: 28px 34px 22px; background: linear-gradient(135deg,#1a237e,#0d47a1 40%,#26a69a); box-shadow:0 12px 32px rgba(13,71,161,0.35); }",
-        "    header h1 { margin:0; font-size: 30px; font-weight:700; color:#fff; letter-spacing:0.4px; }",
-        "    header p { margin:10px 0 0; color:#bbdefb; max-width:720px; line-height:1.45; }",
-        "    main { padding: 28px 34px 56px; }",
-        "    section { margin-bottom: 52px; }",
-        "    section h2 { font-size:24px; margin:0 0 18px; color:#80deea; letter-spacing:0.3px; }",
-        "    .grid { display:grid; gap:26px; grid-template-columns: repeat(auto-fit, minmax(320px, 1fr)); }",
-        "    .card { background:#121a21; border-radius:16px; border:1px solid rgba(128,222,234,0.18); overflow:hidden; box-shadow:0 12px 32px rgba(0,0,0,0.45); display:flex; flex-direction:column; }",
-        "    .card header { padding:20px 22px 18px; border-bottom:1px solid rgba(128,222,234,0.12); background:linear-gradient(135deg,rgba(38,166,154,0.18),rgba(13,71,161,0.18)); }",
-        "    .card header h3 { margin:0; font-size:19px; color:#fff; letter-spacing:0.2px; }",
-        "    .card header p { margin:6px 0 0; color:#b0bec5; font-size:14px; letter-spacing:0.4px; text-transform:uppercase; }",
-        "    .meter { margin:22px 22px 0; height:18px; background:#0f1419; border-radius:999px; position:relative; overflow:hidden; border:1px solid rgba(128,222,234,0.35); box-shadow: inset 0 0 12px rgba(0,0,0,0.45); }",
-        "    .meter .fill { display:block; height:100%; border-radius:999px; background:linear-gradient(90deg,#ef5350,#ffa726,#ffee58,#66bb6a,#26a69a); box-shadow:0 0 20px rgba(102,187,106,0.45); transition:width 0.6s ease; }",
-        "    .meter-label { margin:12px 22px 0; font-size:13px; letter-spacing:0.6px; color:#e0f2f1; text-transform:uppercase; }",
-        "    .card footer { padding:14px 22px 20px; color:#cfd8dc; font-size:13px; background:#10161c; border-top:1px solid rgba(128,222,234,0.12); }",
-        "    .metrics { margin:10px 0 0; display:flex; flex-wrap:wrap; gap:12px; font-size:12px; letter-spacing:0.8px; text-transform:uppercase; }",
-        "    .chip { background:rgba(12,97,109,0.45); padding:7px 12px; border-radius:999px; border:1px solid rgba(128,222,234,0.28); color:#80deea; }",
-        "    .chip strong { color:#e1f5fe; margin-left:4px; font-size:12px; }",
-        "    .note { margin-top: 10px; font-size:12px; color:#90a4ae; letter-spacing:0.3px; }",
-        "    @media (max-width: 720px) { main { padding: 20px 18px 48px; } header { padding: 24px 18px 20px; } }",
-        "  </style>",
-        "</head>",
-        "<body>",
-        "  <header>",
-        "    <h1>Weekly NBA Excitement Dashboard</h1>",
-        "    <p>Each card shows how wild the win-probability swings were without revealing final scores. The excitement bar is scaled 0–10, with colors shifting from calm (left) to chaos (right).</p>",
-        "  </header>",
-        "  <main>",
-    ]
-
+    html_parts = [_DASHBOARD_HEAD]
     for date in sorted(results_by_date.keys(), reverse=True):
-        entries = results_by_date[date]
-        html_parts.append("    <section>")
-        html_parts.append(f"      <h2>{date}</h2>")
-        html_parts.append("      <div class='grid'>")
-        for rank, item in enumerate(entries, start=1):
-            score_pct = f"{item['score_percent'] * 100:.1f}%"
-            html_parts.append("        <article class='card'>")
-            html_parts.append("          <header>")
-            html_parts.append(f"            <h3>{rank}. {item['matchup']}</h3>")
-            html_parts.append(
-                f"            <p>{item['verdict']} &nbsp;&bull;&nbsp; {item['score']:.2f}/10 excitement</p>"
-            )
-            html_parts.append("          </header>")
-            html_parts.append(
-                f"          <div class='meter' role='img' aria-label='Excitement {item['score']:.2f} out of 10'>"
-            )
-            html_parts.append(f"            <span class='fill' style='width:{score_pct};'></span>")
-            html_parts.append("          </div>")
-            html_parts.append(
-                f"          <p class='meter-label'>Intensity meter: {item['score']:.2f}/10</p>"
-            )
-            html_parts.append("          <footer>")
-            html_parts.append("            <div class='metrics'>")
-            html_parts.append(
-                f"              <span class='chip'>Lead changes<strong>{item['lead_changes']}</strong></span>"
-            )
-            html_parts.append(
-                f"              <span class='chip'>Biggest swing<strong>{item['max_swing']:.3f}</strong></span>"
-            )
+        cards = []
+        for rank, item in enumerate(results_by_date[date], start=1):
+            chart_chip = ""
             if include_charts and item.get("image"):
-                html_parts.append(
-                    f"              <span class='chip'>Chart saved<strong>{item['image']}</strong></span>"
+                chart_chip = _CHART_CHIP_TEMPLATE.format(image=item["image"])
+            cards.append(
+                _CARD_TEMPLATE.format(
+                    rank=rank,
+                    score_pct=f"{item['score_percent'] * 100:.1f}%",
+                    chart_chip=chart_chip,
+                    **item,
                 )
-            html_parts.append("            </div>")
-            html_parts.append("            <p class='note'>Higher bars mean more volatile finish-time drama.</p>")
-            html_parts.append("          </footer>")
-            html_parts.append("        </article>")
-        html_parts.append("      </div>")
-        html_parts.append("    </section>")
-
-    html_parts.extend(
-        [
-            "  </main>",
-            "</body>",
-            "</html>",
-        ]
-    )
+            )
+        html_parts.append(_SECTION_TEMPLATE.format(date=date, cards="\n".join(cards)))
+    html_parts.append(_DASHBOARD_TAIL)
 
     dashboard_path.write_text("\n".join(html_parts), encoding="utf-8")
 
@@ -243,6 +322,11 @@ def main() -> None:
         action="store_true",
         help="Also render PNG win probability charts (may reveal spoilers).",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached ESPN responses and refresh them from the network.",
+    )
     args = parser.parse_args()
 
     day_count = max(1, args.days)
@@ -253,43 +337,86 @@ def main() -> None:
     output_dir = Path("plots")
     summary_path = output_dir / "weekly_summary.json"
     dashboard_path = output_dir / "index.html"
-    summary_lines: List[str] = []
+    day_notes: Dict[dt.date, str] = {}
+    game_lines: Dict[dt.date, List[str]] = {}
     results_by_date: Dict[str, List[Dict[str, Any]]] = {}
 
-    for target_date in dates:
-        yyyymmdd = target_date.strftime("%Y%m%d")
-        try:
-            scoreboard = fetch_json(SCOREBOARD_URL, params={"dates": yyyymmdd})
-        except requests.HTTPError as exc:
-            summary_lines.append(f"{target_date}: failed to fetch scoreboard ({exc})")
-            continue
+    # A single figure is redrawn for every chart rather than rebuilt per game.
+    chart_figure = chart_ax = None
+    if include_charts:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        chart_figure, chart_ax = plt.subplots(figsize=(10, 4.5))
+
+    session = create_session()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        scoreboard_jobs = [
+            (
+                target_date,
+                executor.submit(
+                    fetch_json,
+                    session,
+                    SCOREBOARD_URL,
+                    params={"dates": target_date.strftime("%Y%m%d")},
+                    expire_after=scoreboard_expiry(target_date),
+                    refresh=args.no_cache,
+                ),
+            )
+            for target_date in dates
+        ]
 
-        games = extract_game_cards(scoreboard)
-        if not games:
-            summary_lines.append(f"{target_date}: no games.")
-            continue
+        summary_jobs: List[Tuple[dt.date, str, Future]] = []
+        for target_date, scoreboard_job in scoreboard_jobs:
+            try:
+                scoreboard = scoreboard_job.result()
+            except requests.HTTPError as exc:
+                day_notes[target_date] = f"{target_date}: failed to fetch scoreboard ({exc})"
+                continue
+
+            games = extract_game_cards(scoreboard)
+            if not games:
+                day_notes[target_date] = f"{target_date}: no games."
+                continue
+
+            summary_jobs.extend(
+                (
+                    target_date,
+                    describe_matchup(game["competitors"]),
+                    executor.submit(
+                        fetch_json,
+                        session,
+                        SUMMARY_URL,
+                        params={"event": game["event_id"]},
+                        refresh=args.no_cache,
+                    ),
+                )
+                for game in games
+            )
 
-        for game in games:
-            event_id = game["event_id"]
-            matchup = describe_matchup(game["competitors"])
+        # Every game of the week is processed in one flat pass over the queued summaries.
+        for target_date, matchup, summary_job in summary_jobs:
+            lines = game_lines.setdefault(target_date, [])
             try:
-                summary = fetch_json(SUMMARY_URL, params={"event": event_id})
+                summary = summary_job.result()
             except requests.HTTPError as exc:
-                summary_lines.append(f"{target_date} {matchup}: summary fetch failed ({exc})")
+                lines.append(f"{target_date} {matchup}: summary fetch failed ({exc})")
                 continue
 
             winprob = summary.get("winprobability")
-            if not isinstance(winprob, list) or not winprob:
-                summary_lines.append(f"{target_date} {matchup}: no win probability data.")
+            if not isinstance(winprob, list) or len(winprob) < 2:
+                lines.append(f"{target_date} {matchup}: not enough win probability data.")
                 continue
 
             try:
-                probabilities = load_home_win_probabilities(winprob)
+                probabilities, play_ids = load_home_win_probabilities_with_ids(winprob)
             except (KeyError, ValueError) as exc:
-                summary_lines.append(f"{target_date} {matchup}: invalid data ({exc})")
+                lines.append(f"{target_date} {matchup}: invalid data ({exc})")
                 continue
 
-            play_ids = [entry.get("playId", str(idx)) for idx, entry in enumerate(winprob)]
             excitement = calculate_excitement(probabilities)
 
             image_name: Optional[str] = None
@@ -297,19 +424,22 @@ def main() -> None:
                 filename = f"{target_date.isoformat()}_{slugify(matchup)}.png"
                 output_path = output_dir / filename
                 plot_win_probability(
+                    chart_ax,
                     probabilities,
                     play_ids,
                     matchup,
                     target_date.isoformat(),
                     excitement,
-                    output_path,
                 )
+                chart_figure.tight_layout()
+                chart_figure.savefig(output_path, dpi=100)
+                chart_ax.cla()
                 image_name = output_path.name
-                summary_lines.append(
+                lines.append(
                     f"{target_date} {matchup}: saved {output_path.name} (score {excitement.score:.2f})"
                 )
             else:
-                summary_lines.append(
+                lines.append(
                     f"{target_date} {matchup}: excitement {excitement.score:.2f} (charts disabled)"
                 )
 
@@ -326,6 +456,16 @@ def main() -> None:
                 }
             )
 
+    if chart_figure is not None:
+        plt.close(chart_figure)
+
+    summary_lines: List[str] = []
+    for target_date in dates:
+        if target_date in day_notes:
+            summary_lines.append(day_notes[target_date])
+        else:
+            summary_lines.extend(game_lines.get(target_date, []))
+
     print("Excitement summaries:")
     for line in summary_lines:
         print(" -", line)
@@ -335,10 +475,13 @@ def main() -> None:
         return
 
     for entries in results_by_date.values():
-        entries.sort(key=lambda item: item["score"], reverse=True)
+        entries.sort(key=itemgetter("score"), reverse=True)
 
     summary_path.parent.mkdir(parents=True, exist_ok=True)
-    summary_path.write_text(json.dumps(results_by_date, indent=2), encoding="utf-8")
+    if orjson is not None:
+        summary_path.write_bytes(orjson.dumps(results_by_date, option=orjson.OPT_INDENT_2))
+    else:
+        summary_path.write_text(json.dumps(results_by_date, indent=2), encoding="utf-8")
 
     build_dashboard(results_by_date, dashboard_path=dashboard_path, include_charts=include_charts)
     print(f"\nSaved summary JSON to {summary_path}")
@@ -13,12 +13,9 @@ import json
 from pathlib import Path
 from typing import Sequence
 
-import matplotlib
+import numpy as np
 
-matplotlib.use("Agg")  # ensure we can render without a display
-import matplotlib.pyplot as plt
-
-from excitement import calculate_excitement, load_home_win_probabilities
+from excitement import calculate_excitement, load_home_win_probabilities_with_ids
 
 
 def derive_x_axis_labels(play_ids: Sequence[str]) -> list[str]:
@@ -47,18 +44,24 @@ def main() -> None:
     )
     args = parser.parse_args()
 
+    # Imported here so reusing this module's helpers does not pay for matplotlib.
+    import matplotlib
+
+    matplotlib.use("Agg")  # ensure we can render without a display
+    import matplotlib.pyplot as plt
+
     payload = json.loads(Path(args.input_file).read_text(encoding="utf-8"))
     winprob_entries = payload.get("winprobability")
     if not isinstance(winprob_entries, list):
         raise KeyError("JSON is missing the top-level 'winprobability' list")
 
-    probabilities = load_home_win_probabilities(winprob_entries)
-    play_ids = [entry.get("playId", str(index)) for index, entry in enumerate(winprob_entries)]
+    probabilities, play_ids = load_home_win_probabilities_with_ids(winprob_entries)
     labels = derive_x_axis_labels(play_ids)
 
     excitement = calculate_excitement(probabilities)
-    percent_values = [p * 100 for p in probabilities]
-    indices = list(range(len(percent_values)))
+    percent_values = np.asarray(probabilities, dtype=np.float64) * 100.0
+    indices = np.arange(len(percent_values))
+    home_ahead = percent_values >= 50.0
 
     fig, ax = plt.subplots(figsize=(10, 4.5))
     ax.plot(indices, percent_values, color="#1f77b4", linewidth=2, label="Home win %")
@@ -66,7 +69,7 @@ def main() -> None:
         indices,
         percent_values,
         50,
-        where=[value >= 50 for value in percent_values],
+        where=home_ahead,
         color="#1f77b4",
         alpha=0.15,
     )
@@ -74,7 +77,7 @@ def main() -> None:
         indices,
         percent_values,
         50,
-        where=[value < 50 for value in percent_values],
+        where=~home_ahead,
         color="#d62728",
         alpha=0.15,
     )
@@ -90,12 +93,8 @@ def main() -> None:
 
     tick_count = min(10, len(labels))
     if tick_count > 1:
-        step = max(1, len(labels) // tick_count)
-        positions = indices[::step]
-        tick_labels = labels[::step]
-        if len(positions) > tick_count:
-            positions = positions[:tick_count]
-            tick_labels = tick_labels[:tick_count]
+        positions = np.linspace(0, len(labels) - 1, tick_count, dtype=int)
+        tick_labels = [labels[position] for position in positions]
         ax.set_xticks(positions)
         ax.set_xticklabels(tick_labels, rotation=45, fontsize=8)
     else: